@@ -1,4 +1,6 @@
 #!/usr/bin/env python3
+from array import array
+import operator
 
 def main():
     depths = read_depths()
@@ -13,9 +15,23 @@ def main():
 
     print(f'Answer: {increase_count}')
 
+def main_batch():
+    depths = read_depths_array()
+
+    increase_count = count_increases(depths)
+
+    print(f'Answer: {increase_count}')
+
+def count_increases(depths: array) -> int:
+    return sum(map(operator.gt, memoryview(depths)[1:], depths))
+
 def read_depths():
     with open('input.txt') as f:
         return [int(x) for x in f]
 
+def read_depths_array() -> array:
+    with open('input.txt') as f:
+        return array('q', map(int, f.read().split()))
+
 if __name__ == '__main__':
     main()
@@ -1,27 +1,136 @@
 #!/usr/bin/env python3
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Deque, Iterable, Iterator, List, NamedTuple, Optional
+import operator
+import os
 
 WINDOW_SIZE = 3
 
-def main():
+
+class Chunk(NamedTuple):
+    start: int
+    end: int
+
+class ChunkCount(NamedTuple):
+    increases: int
+    head: List[int]
+    tail: List[int]
+
+
+def main(window_size: int = WINDOW_SIZE):
     depths = read_depths()
+    window_sums = sliding_window_sums(depths, window_size)
 
-    increase_count = 0
-    last_window_sum = None
+    increase_count = count_increases(window_sums)
 
-    for i in range(len(depths) - WINDOW_SIZE + 1):
-        next_window_sum = sum(depths[i:i+WINDOW_SIZE])
+    print(f'Answer: {increase_count}')
 
-        if last_window_sum and next_window_sum > last_window_sum:
-            increase_count += 1
+def main_batch(window_size: int = WINDOW_SIZE):
+    depths = read_depths_array()
+
+    increase_count = count_window_increases(depths, window_size)
+
+    print(f'Answer: {increase_count}')
 
-        last_window_sum = next_window_sum
+def main_parallel(window_size: int = WINDOW_SIZE, workers: Optional[int] = None):
+    workers = workers or os.cpu_count() or 1
+    chunks = find_chunks('input.txt', workers)
 
+    with ProcessPoolExecutor(workers) as executor:
+        chunk_counts = executor.map(count_chunk_increases, repeat('input.txt'), chunks, repeat(window_size))
+        increase_count = merge_chunk_counts(chunk_counts, window_size)
 
     print(f'Answer: {increase_count}')
 
-def read_depths():
+def sliding_window_sums(depths: Iterable[int], window_size: int) -> Iterator[int]:
+    window: Deque[int] = deque(maxlen=window_size)
+    window_sum = 0
+
+    for depth in depths:
+        # Appending to a full deque drops the oldest depth
+        if len(window) == window_size:
+            window_sum -= window[0]
+
+        window.append(depth)
+        window_sum += depth
+
+        if len(window) == window_size:
+            yield window_sum
+
+def count_increases(values: Iterable[int]) -> int:
+    increase_count = 0
+    last = None
+
+    for value in values:
+        if last is not None and value > last:
+            increase_count += 1
+
+        last = value
+
+    return increase_count
+
+def count_window_increases(depths: array, window_size: int) -> int:
+    # Neighbouring windows share all but one depth, so comparing their sums
+    # reduces to comparing the depth entering with the depth leaving
+    entering = memoryview(depths)[window_size:]
+    return sum(map(operator.gt, entering, depths))
+
+def find_chunks(filename: str, count: int) -> List[Chunk]:
+    size = os.path.getsize(filename)
+    boundaries = [0]
+
+    with open(filename, 'rb') as f:
+        for i in range(1, count):
+            offset = size * i // count
+
+            if offset <= boundaries[-1]:
+                continue
+
+            # Move the boundary forward to the start of the next line
+            f.seek(offset)
+            f.readline()
+            boundaries.append(f.tell())
+
+    boundaries.append(size)
+
+    return [Chunk(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+def count_chunk_increases(filename: str, chunk: Chunk, window_size: int) -> ChunkCount:
+    with open(filename, 'rb') as f:
+        f.seek(chunk.start)
+        depths = array('q', map(int, f.read(chunk.end - chunk.start).split()))
+
+    increases = count_window_increases(depths, window_size)
+    return ChunkCount(increases, depths[:window_size].tolist(), depths[-window_size:].tolist())
+
+def merge_chunk_counts(chunk_counts: Iterable[ChunkCount], window_size: int) -> int:
+    increase_count = 0
+    tail: List[int] = []
+
+    for chunk_count in chunk_counts:
+        increase_count += chunk_count.increases
+
+        # Compare depths leaving from earlier chunks with depths entering from this one
+        joined = tail + chunk_count.head
+        for i in range(len(tail)):
+            if i + window_size < len(joined) and joined[i + window_size] > joined[i]:
+                increase_count += 1
+
+        tail = (tail + chunk_count.tail)[-window_size:]
+
+    return increase_count
+
+def read_depths() -> Iterator[int]:
+    with open('input.txt') as f:
+        for line in f:
+            yield int(line)
+
+def read_depths_array() -> array:
     with open('input.txt') as f:
-        return [int(x) for x in f]
+        return array('q', map(int, f.read().split()))
 
 if __name__ == '__main__':
     main()
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
+from array import array
 from enum import Enum
-from typing import NamedTuple, List
+from itertools import accumulate, islice
+from typing import NamedTuple, List, Tuple
+import operator
 
 def main():
     instructions = read_instructions()
@@ -12,6 +15,15 @@ def main():
     answer = submarine.x * submarine.depth
     print(f'Answer: {answer}')
 
+def main_replay():
+    instructions = read_instruction_arrays()
+    submarine = Submarine()
+
+    submarine.replay(instructions)
+
+    answer = submarine.x * submarine.depth
+    print(f'Answer: {answer}')
+
 
 class Direction(Enum):
     FORWARD = 'forward'
@@ -22,6 +34,14 @@ class Instruction(NamedTuple):
     direction: Direction
     value: int
 
+class InstructionArrays(NamedTuple):
+    directions: bytes
+    values: array
+
+# Map the first byte of each direction to its signed effect on x and aim
+FORWARD_CODES = bytes.maketrans(b'fdu', b'\x01\x00\x00')
+AIM_CODES = bytes.maketrans(b'fdu', b'\x00\x01\xff')
+
 class Submarine:
 
     def __init__(self):
@@ -39,6 +59,16 @@ class Submarine:
         func = self.move_funcs[instruction.direction]
         func(instruction.value)
 
+    def replay(self, instructions: InstructionArrays):
+        forward_values, aim_values = get_signed_values(instructions)
+
+        # Aim before each instruction is a prefix sum, so depth is a dot product
+        aims = accumulate(aim_values, initial=self.aim)
+        self.depth += sum(map(operator.mul, aims, forward_values))
+
+        self.x += sum(forward_values)
+        self.aim += sum(aim_values)
+
     def moveForward(self, value: int):
         self.x += value
         self.depth += self.aim * value
@@ -50,11 +80,70 @@ class Submarine:
         self.aim -= value
 
 
+class Position(NamedTuple):
+    x: int
+    depth: int
+    aim: int
+
+class Trajectory:
+    def __init__(self):
+        # Position after each prefix of the instruction stream, starting with the empty prefix
+        self.xs = array('q', [0])
+        self.depths = array('q', [0])
+        self.aims = array('q', [0])
+
+    def __len__(self) -> int:
+        return len(self.xs) - 1
+
+    def position(self, k: int) -> Position:
+        return Position(self.xs[k], self.depths[k], self.aims[k])
+
+    def submarine_at(self, k: int) -> Submarine:
+        submarine = Submarine()
+        submarine.x, submarine.depth, submarine.aim = self.position(k)
+        return submarine
+
+    def append(self, instruction: Instruction):
+        submarine = self.submarine_at(len(self))
+        submarine.move(instruction)
+
+        self.xs.append(submarine.x)
+        self.depths.append(submarine.depth)
+        self.aims.append(submarine.aim)
+
+    def extend(self, instructions: InstructionArrays):
+        forward_values, aim_values = get_signed_values(instructions)
+
+        aims = list(accumulate(aim_values, initial=self.aims[-1]))
+        depth_changes = map(operator.mul, aims, forward_values)
+
+        # Skip the initial values, which are already the last stored position
+        self.xs.extend(islice(accumulate(forward_values, initial=self.xs[-1]), 1, None))
+        self.depths.extend(islice(accumulate(depth_changes, initial=self.depths[-1]), 1, None))
+        self.aims.extend(islice(aims, 1, None))
+
+
+def get_signed_values(instructions: InstructionArrays) -> Tuple[List[int], List[int]]:
+    forward_signs = array('b', instructions.directions.translate(FORWARD_CODES))
+    aim_signs = array('b', instructions.directions.translate(AIM_CODES))
+
+    forward_values = list(map(operator.mul, forward_signs, instructions.values))
+    aim_values = list(map(operator.mul, aim_signs, instructions.values))
+    return forward_values, aim_values
+
 def read_instructions() -> List[Instruction]:
     with open('input.txt') as f:
         lines = f.readlines()
         return list(map(parse_instruction, lines))
 
+def read_instruction_arrays() -> InstructionArrays:
+    with open('input.txt', 'rb') as f:
+        words = f.read().split()
+
+    directions = bytes(w[0] for w in words[0::2])
+    values = array('q', map(int, words[1::2]))
+    return InstructionArrays(directions, values)
+
 def parse_instruction(instruction: str) -> Instruction:
     direction, value = instruction.split()
     direction = Direction[direction.upper()]
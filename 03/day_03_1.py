@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+from array import array
 from typing import List
 
 
@@ -15,6 +16,28 @@ def main():
     print(f'Answer: {answer}')
 
 
+def main_packed():
+    report = read_packed_report()
+
+    gamma_rate = calculate_packed_gamma_rate(report)
+    epsilon_rate = gamma_rate ^ ((1 << report.width) - 1)
+
+    answer = gamma_rate * epsilon_rate
+    print(f'Answer: {answer}')
+
+
+class PackedReport:
+    def __init__(self, lines: List[bytes]):
+        self.width = len(lines[0])
+        self.size = len(lines)
+        self.values = array('Q', (int(l, 2) for l in lines))
+
+        # Bit i of columns[c] holds bit c (from the left) of line i
+        data = b''.join(lines)
+        self.columns = [int(data[c::self.width][::-1], 2) for c in range(self.width)]
+        self.all_rows = (1 << self.size) - 1
+
+
 def calculate_gamma_rate(report: List[str]) -> str:
     gamma_rate = ''
 
@@ -33,6 +56,18 @@ def calculate_gamma_rate(report: List[str]) -> str:
     return gamma_rate
 
 
+def calculate_packed_gamma_rate(report: PackedReport) -> int:
+    gamma_rate = 0
+
+    for column in report.columns:
+        ones = count_bits(column)
+        zeros = report.size - ones
+
+        gamma_rate = (gamma_rate << 1) | (ones > zeros)
+
+    return gamma_rate
+
+
 def convert_gamma_to_epsilon(gamma_rate: str) -> str:
     epsilon_rate = ''
 
@@ -45,9 +80,18 @@ def convert_gamma_to_epsilon(gamma_rate: str) -> str:
     return epsilon_rate
 
 
+def count_bits(value: int) -> int:
+    # int.bit_count() needs Python 3.10
+    return bin(value).count('1')
+
+
 def read_report() -> List[str]:
     with open('input.txt') as f:
         return [l.strip() for l in f]
 
+def read_packed_report() -> PackedReport:
+    with open('input.txt', 'rb') as f:
+        return PackedReport(f.read().split())
+
 if __name__ == '__main__':
     main()
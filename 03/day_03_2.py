@@ -1,4 +1,5 @@
 #!/usr/bin/env python3
+from array import array
 from typing import List
 from enum import Enum
 
@@ -19,6 +20,91 @@ def main():
     print(f'Answer: {answer}')
 
 
+def main_packed():
+    report = read_packed_report()
+
+    oxygen_generator_rating = filter_packed_values(report, BitCriteria.MOST_COMMON)
+    co2_scrubber_rating = filter_packed_values(report, BitCriteria.LEAST_COMMON)
+
+    answer = oxygen_generator_rating * co2_scrubber_rating
+    print(f'Answer: {answer}')
+
+
+def main_trie():
+    report = read_report()
+    trie = ReportTrie(len(report[0]))
+
+    for value in report:
+        trie.insert(value)
+
+    oxygen_generator_rating = trie.find_rating(BitCriteria.MOST_COMMON)
+    co2_scrubber_rating = trie.find_rating(BitCriteria.LEAST_COMMON)
+
+    answer = oxygen_generator_rating * co2_scrubber_rating
+    print(f'Answer: {answer}')
+
+
+class PackedReport:
+    def __init__(self, lines: List[bytes]):
+        self.width = len(lines[0])
+        self.size = len(lines)
+        self.values = array('Q', (int(l, 2) for l in lines))
+
+        # Bit i of columns[c] holds bit c (from the left) of line i
+        data = b''.join(lines)
+        self.columns = [int(data[c::self.width][::-1], 2) for c in range(self.width)]
+        self.all_rows = (1 << self.size) - 1
+
+
+class ReportTrie:
+    def __init__(self, width: int):
+        self.width = width
+
+        # Node 0 is an empty placeholder used for missing children, node 1 is the root
+        self.children = [array('l', [0, 0]), array('l', [0, 0])]
+        self.counts = array('l', [0, 0])
+
+    def insert(self, value: str):
+        node = 1
+        self.counts[node] += 1
+
+        for char in value:
+            bit_children = self.children[int(char)]
+            child = bit_children[node]
+
+            if not child:
+                child = len(self.counts)
+                bit_children[node] = child
+                self.children[0].append(0)
+                self.children[1].append(0)
+                self.counts.append(0)
+
+            self.counts[child] += 1
+            node = child
+
+    def find_rating(self, bit_criteria: BitCriteria) -> int:
+        node = 1
+        rating = 0
+
+        for _ in range(self.width):
+            ones = self.counts[self.children[1][node]]
+            zeros = self.counts[self.children[0][node]]
+
+            keep_bit = 1 if ones >= zeros else 0
+
+            if bit_criteria == BitCriteria.LEAST_COMMON:
+                keep_bit = 1 - keep_bit
+
+            # If every remaining value has the same bit there is only one path to follow
+            if ones == 0 or zeros == 0:
+                keep_bit = 1 if ones else 0
+
+            node = self.children[keep_bit][node]
+            rating = (rating << 1) | keep_bit
+
+        return rating
+
+
 def filter_values(values: List[str], bit_criteria: BitCriteria) -> str:
     for bit in range(len(values[0])):
         bits = [int(v[bit]) for v in values]
@@ -44,9 +130,46 @@ def filter_values(values: List[str], bit_criteria: BitCriteria) -> str:
     return values[0]
 
 
+def filter_packed_values(report: PackedReport, bit_criteria: BitCriteria) -> int:
+    rows = report.all_rows
+
+    for column in report.columns:
+        ones_rows = rows & column
+        zeros_rows = rows & ~column
+
+        ones = count_bits(ones_rows)
+        zeros = count_bits(zeros_rows)
+
+        keep_ones = ones >= zeros
+
+        if bit_criteria == BitCriteria.LEAST_COMMON:
+            keep_ones = not keep_ones
+
+        # If every remaining value has the same bit there is only one side to keep
+        if ones == 0 or zeros == 0:
+            keep_ones = ones > 0
+
+        rows = ones_rows if keep_ones else zeros_rows
+
+        if count_bits(rows) == 1:
+            break
+
+    assert rows, 'No values left after filtering'
+    return report.values[rows.bit_length() - 1]
+
+
+def count_bits(value: int) -> int:
+    # int.bit_count() needs Python 3.10
+    return bin(value).count('1')
+
+
 def read_report() -> List[str]:
     with open('input.txt') as f:
         return [l.strip() for l in f]
 
+def read_packed_report() -> PackedReport:
+    with open('input.txt', 'rb') as f:
+        return PackedReport(f.read().split())
+
 if __name__ == '__main__':
     main()
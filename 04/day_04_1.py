@@ -1,7 +1,9 @@
 #!/usr/bin/env python3
-from typing import List, NamedTuple, Optional
+from typing import Dict, List, NamedTuple, Optional
+import sys
 
 BOARD_SIZE = 5
+NEVER_DRAWN = sys.maxsize
 
 class Board:
     def __init__(self, numbers: List[List[int]]):
@@ -114,6 +116,66 @@ def main():
         print(f'Answer: {answer}')
 
 
+def main_precomputed():
+    input = read_input()
+    draw_positions = get_draw_positions(input.draw_order)
+
+    win_draws = [calculate_win_draw(b, draw_positions) for b in input.boards]
+
+    # Boards that never complete a line can't be the winner
+    winners = [i for i, draw in enumerate(win_draws) if draw != NEVER_DRAWN]
+
+    if not winners:
+        print('Winning Board:')
+        print(None)
+        print()
+        return
+
+    board_index = min(winners, key=win_draws.__getitem__)
+
+    winning_board = input.boards[board_index]
+    win_draw = win_draws[board_index]
+    draw_number = input.draw_order[win_draw]
+
+    mark_called_until(winning_board, draw_positions, win_draw)
+
+    print('Winning Board:')
+    print(winning_board)
+    print()
+
+    uncalled_sum = winning_board.get_uncalled_sum()
+    answer = uncalled_sum * draw_number
+
+    print(f'Uncalled Sum: {uncalled_sum}')
+    print(f'Draw Number: {draw_number}')
+    print(f'Answer: {answer}')
+
+
+def get_draw_positions(draw_order: List[int]) -> Dict[int, int]:
+    draw_positions: Dict[int, int] = {}
+
+    for i, number in enumerate(draw_order):
+        draw_positions.setdefault(number, i)
+
+    return draw_positions
+
+
+def calculate_win_draw(board: Board, draw_positions: Dict[int, int]) -> int:
+    cell_draws = [[draw_positions.get(n, NEVER_DRAWN) for n in row] for row in board.numbers]
+
+    # A line completes on the last draw of its cells, the board on its first complete line
+    row_draws = [max(row) for row in cell_draws]
+    col_draws = [max(col) for col in zip(*cell_draws)]
+
+    return min(row_draws + col_draws)
+
+
+def mark_called_until(board: Board, draw_positions: Dict[int, int], draw: int):
+    for y in range(BOARD_SIZE):
+        for x in range(BOARD_SIZE):
+            board.called[y][x] = draw_positions.get(board.numbers[y][x], NEVER_DRAWN) <= draw
+
+
 def read_input() -> Input:
     with open('input.txt') as f:
         parts = f.read().strip().split('\n\n')
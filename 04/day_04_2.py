@@ -1,7 +1,16 @@
 #!/usr/bin/env python3
-from typing import List, NamedTuple, Optional
+from array import array
+from collections import defaultdict
+from typing import DefaultDict, Dict, List, NamedTuple, Optional
+import sys
 
 BOARD_SIZE = 5
+NEVER_DRAWN = sys.maxsize
+CELL_COUNT = BOARD_SIZE * BOARD_SIZE
+
+# Bit y * BOARD_SIZE + x of a called mask is set once cell (x, y) is called
+ROW_MASKS = [((1 << BOARD_SIZE) - 1) << (y * BOARD_SIZE) for y in range(BOARD_SIZE)]
+COL_MASKS = [sum(1 << (y * BOARD_SIZE + x) for y in range(BOARD_SIZE)) for x in range(BOARD_SIZE)]
 
 class Board:
     def __init__(self, numbers: List[List[int]]):
@@ -83,11 +92,119 @@ class Bingo:
         return winning_boards
 
 
+class CellPosition(NamedTuple):
+    board: int
+    x: int
+    y: int
+
+
+class IndexedBingo:
+    def __init__(self, boards: List[Board]):
+        self.boards = boards
+        self.remaining = len(boards)
+        self.won = [False] * len(boards)
+
+        # Called cells per row and column, flattened as board * BOARD_SIZE + index
+        self.row_hits = [0] * (len(boards) * BOARD_SIZE)
+        self.col_hits = [0] * (len(boards) * BOARD_SIZE)
+
+        self.positions: DefaultDict[int, List[CellPosition]] = defaultdict(list)
+
+        for i, board in enumerate(boards):
+            for y, row in enumerate(board.numbers):
+                for x, number in enumerate(row):
+                    self.positions[number].append(CellPosition(i, x, y))
+
+    def call_number(self, number: int) -> List[Board]:
+        winning_boards: List[Board] = []
+
+        for i, x, y in self.positions.pop(number, []):
+            if self.won[i]:
+                continue
+
+            self.boards[i].called[y][x] = True
+
+            row = i * BOARD_SIZE + y
+            col = i * BOARD_SIZE + x
+            self.row_hits[row] += 1
+            self.col_hits[col] += 1
+
+            if self.row_hits[row] == BOARD_SIZE or self.col_hits[col] == BOARD_SIZE:
+                self.won[i] = True
+                self.remaining -= 1
+                winning_boards.append(self.boards[i])
+
+        return winning_boards
+
+
+class BoardStore:
+    def __init__(self, numbers: array):
+        self.size = len(numbers) // CELL_COUNT
+        self.numbers = numbers
+        self.called = array('I', [0]) * self.size
+        self.alive = bytearray([0xff]) * ((self.size + 7) // 8)
+        self.remaining = self.size
+
+        # Flat cell indices (board * CELL_COUNT + cell) for each number
+        self.positions: DefaultDict[int, array] = defaultdict(lambda: array('i'))
+
+        for i, number in enumerate(self.numbers):
+            self.positions[number].append(i)
+
+    def is_alive(self, board: int) -> bool:
+        return bool(self.alive[board >> 3] & (1 << (board & 7)))
+
+    def call_number(self, number: int) -> List[int]:
+        winning_boards: List[int] = []
+
+        for i in self.positions.pop(number, []):
+            board, cell = divmod(i, CELL_COUNT)
+
+            if not self.is_alive(board):
+                continue
+
+            called = self.called[board] | (1 << cell)
+            self.called[board] = called
+
+            y, x = divmod(cell, BOARD_SIZE)
+            row_mask = ROW_MASKS[y]
+            col_mask = COL_MASKS[x]
+
+            if called & row_mask == row_mask or called & col_mask == col_mask:
+                self.alive[board >> 3] &= ~(1 << (board & 7))
+                self.remaining -= 1
+                winning_boards.append(board)
+
+        return winning_boards
+
+    def get_uncalled_sum(self, board: int) -> int:
+        start = board * CELL_COUNT
+        called = self.called[board]
+        return sum(n for cell, n in enumerate(self.numbers[start:start + CELL_COUNT]) if not called >> cell & 1)
+
+    def get_board(self, board: int) -> Board:
+        start = board * CELL_COUNT
+        numbers = self.numbers[start:start + CELL_COUNT].tolist()
+
+        result = Board([numbers[y * BOARD_SIZE:(y + 1) * BOARD_SIZE] for y in range(BOARD_SIZE)])
+
+        for y in range(BOARD_SIZE):
+            for x in range(BOARD_SIZE):
+                result.called[y][x] = bool(self.called[board] >> (y * BOARD_SIZE + x) & 1)
+
+        return result
+
+
 class Input(NamedTuple):
     draw_order: List[int]
     boards: List[Board]
 
 
+class StoreInput(NamedTuple):
+    draw_order: List[int]
+    store: BoardStore
+
+
 def main():
     input = read_input()
     bingo = Bingo(input.boards)
@@ -118,6 +235,122 @@ def main():
         print(f'Answer: {answer}')
 
 
+def main_indexed():
+    input = read_input()
+    bingo = IndexedBingo(input.boards)
+
+    winning_boards = []
+    draw_number = None
+
+    for draw_number in input.draw_order:
+        winning_boards = bingo.call_number(draw_number)
+
+        if bingo.remaining == 0:
+            break
+
+    last_winning_board = winning_boards[0]
+
+    print('Last Winning Board:')
+    print(last_winning_board)
+    print()
+
+    if draw_number and last_winning_board:
+        uncalled_sum = last_winning_board.get_uncalled_sum()
+        answer = uncalled_sum * draw_number
+
+        print(f'Uncalled Sum: {uncalled_sum}')
+        print(f'Draw Number: {draw_number}')
+        print(f'Answer: {answer}')
+
+
+def main_store():
+    input = read_store_input()
+    store = input.store
+
+    winning_boards = []
+    draw_number = None
+
+    for draw_number in input.draw_order:
+        winning_boards = store.call_number(draw_number)
+
+        if store.remaining == 0:
+            break
+
+    last_winning_board = winning_boards[0]
+
+    print('Last Winning Board:')
+    print(store.get_board(last_winning_board))
+    print()
+
+    if draw_number:
+        uncalled_sum = store.get_uncalled_sum(last_winning_board)
+        answer = uncalled_sum * draw_number
+
+        print(f'Uncalled Sum: {uncalled_sum}')
+        print(f'Draw Number: {draw_number}')
+        print(f'Answer: {answer}')
+
+
+def main_precomputed():
+    input = read_input()
+    draw_positions = get_draw_positions(input.draw_order)
+
+    win_draws = [calculate_win_draw(b, draw_positions) for b in input.boards]
+
+    # Boards that never complete a line can't be the winner
+    winners = [i for i, draw in enumerate(win_draws) if draw != NEVER_DRAWN]
+
+    if not winners:
+        print('Last Winning Board:')
+        print(None)
+        print()
+        return
+
+    board_index = max(winners, key=win_draws.__getitem__)
+
+    last_winning_board = input.boards[board_index]
+    win_draw = win_draws[board_index]
+    draw_number = input.draw_order[win_draw]
+
+    mark_called_until(last_winning_board, draw_positions, win_draw)
+
+    print('Last Winning Board:')
+    print(last_winning_board)
+    print()
+
+    uncalled_sum = last_winning_board.get_uncalled_sum()
+    answer = uncalled_sum * draw_number
+
+    print(f'Uncalled Sum: {uncalled_sum}')
+    print(f'Draw Number: {draw_number}')
+    print(f'Answer: {answer}')
+
+
+def get_draw_positions(draw_order: List[int]) -> Dict[int, int]:
+    draw_positions: Dict[int, int] = {}
+
+    for i, number in enumerate(draw_order):
+        draw_positions.setdefault(number, i)
+
+    return draw_positions
+
+
+def calculate_win_draw(board: Board, draw_positions: Dict[int, int]) -> int:
+    cell_draws = [[draw_positions.get(n, NEVER_DRAWN) for n in row] for row in board.numbers]
+
+    # A line completes on the last draw of its cells, the board on its first complete line
+    row_draws = [max(row) for row in cell_draws]
+    col_draws = [max(col) for col in zip(*cell_draws)]
+
+    return min(row_draws + col_draws)
+
+
+def mark_called_until(board: Board, draw_positions: Dict[int, int], draw: int):
+    for y in range(BOARD_SIZE):
+        for x in range(BOARD_SIZE):
+            board.called[y][x] = draw_positions.get(board.numbers[y][x], NEVER_DRAWN) <= draw
+
+
 def read_input() -> Input:
     with open('input.txt') as f:
         parts = f.read().strip().split('\n\n')
@@ -134,5 +367,17 @@ def read_input() -> Input:
     return Input(draw_order, boards)
 
 
+def read_store_input() -> StoreInput:
+    with open('input.txt') as f:
+        draw_order_line, boards_text = f.read().strip().split('\n\n', 1)
+
+    draw_order = [int(n) for n in draw_order_line.split(',')]
+
+    # Parse every board number straight into one flat array, without any Board objects
+    numbers = array('i', map(int, boards_text.split()))
+
+    return StoreInput(draw_order, BoardStore(numbers))
+
+
 if __name__ == '__main__':
     main()
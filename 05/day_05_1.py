@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
-from typing import NamedTuple, List, Optional, DefaultDict
+from typing import NamedTuple, List, Optional, DefaultDict, Dict, Set, Tuple
+from enum import Enum
 from collections import defaultdict
+import bisect
 import re
+import sys
 
 
 class Point(NamedTuple):
@@ -45,6 +48,163 @@ class Map:
         return sum(1 for count in self.points.values() if count >= 2)
 
 
+class Interval(NamedTuple):
+    start: int
+    end: int
+
+
+class Orientation(Enum):
+    HORIZONTAL = 1
+    VERTICAL = 2
+    DIAGONAL_UP = 3
+    DIAGONAL_DOWN = 4
+
+    # Each line lies along a constant of its orientation, with points indexed by a position
+    def get_key(self, point: Point) -> Tuple[int, int]:
+        if self == Orientation.HORIZONTAL:
+            return point.y, point.x
+        if self == Orientation.VERTICAL:
+            return point.x, point.y
+        if self == Orientation.DIAGONAL_UP:
+            return point.x - point.y, point.x
+        return point.x + point.y, point.x
+
+    def get_point(self, constant: int, position: int) -> Point:
+        if self == Orientation.HORIZONTAL:
+            return Point(position, constant)
+        if self == Orientation.VERTICAL:
+            return Point(constant, position)
+        if self == Orientation.DIAGONAL_UP:
+            return Point(position, position - constant)
+        return Point(position, constant - position)
+
+
+Segments = Dict[int, List[Interval]]
+
+class SweepMap:
+    def __init__(self):
+        self.segments: Dict[Orientation, DefaultDict[int, List[Interval]]] = {o: defaultdict(list) for o in Orientation}
+
+    def add_line(self, line: Line):
+        orientation = get_orientation(line)
+
+        # Only horizontal and vertical lines are considered
+        if orientation not in (Orientation.HORIZONTAL, Orientation.VERTICAL):
+            return
+
+        constant, start = orientation.get_key(line.p1)
+        _, end = orientation.get_key(line.p2)
+
+        self.segments[orientation][constant].append(Interval(min(start, end), max(start, end)))
+
+    def count_overlapping_points(self) -> int:
+        covered: Dict[Orientation, Segments] = {o: {} for o in Orientation}
+        overlapping: Dict[Orientation, Segments] = {o: {} for o in Orientation}
+
+        for orientation, lines in self.segments.items():
+            for constant, intervals in lines.items():
+                covered[orientation][constant], overlapping[orientation][constant] = sweep_intervals(intervals)
+
+        crossings = find_crossings(covered)
+        count = len(crossings)
+
+        # Collinear overlaps of different orientations can only meet at crossings
+        for orientation, segments in overlapping.items():
+            count += sum(i.end - i.start + 1 for intervals in segments.values() for i in intervals)
+
+            for point in crossings:
+                constant, position = orientation.get_key(point)
+                if constant in segments and contains(segments[constant], position):
+                    count -= 1
+
+        return count
+
+
+def get_orientation(line: Line) -> Orientation:
+    if line.p1.y == line.p2.y:
+        return Orientation.HORIZONTAL
+    if line.p1.x == line.p2.x:
+        return Orientation.VERTICAL
+    if (line.p2.x - line.p1.x) == (line.p2.y - line.p1.y):
+        return Orientation.DIAGONAL_UP
+    return Orientation.DIAGONAL_DOWN
+
+def sweep_intervals(intervals: List[Interval]) -> Tuple[List[Interval], List[Interval]]:
+    changes: DefaultDict[int, int] = defaultdict(int)
+
+    for interval in intervals:
+        changes[interval.start] += 1
+        changes[interval.end + 1] -= 1
+
+    covered: List[Interval] = []
+    overlapping: List[Interval] = []
+    covered_start = overlapping_start = 0
+    depth = 0
+
+    for position in sorted(changes):
+        new_depth = depth + changes[position]
+
+        if depth < 1 <= new_depth:
+            covered_start = position
+        elif new_depth < 1 <= depth:
+            covered.append(Interval(covered_start, position - 1))
+
+        if depth < 2 <= new_depth:
+            overlapping_start = position
+        elif new_depth < 2 <= depth:
+            overlapping.append(Interval(overlapping_start, position - 1))
+
+        depth = new_depth
+
+    return covered, overlapping
+
+def contains(intervals: List[Interval], position: int) -> bool:
+    i = bisect.bisect_right(intervals, Interval(position, sys.maxsize)) - 1
+    return i >= 0 and intervals[i].end >= position
+
+def find_crossings(covered: Dict[Orientation, Segments]) -> Set[Point]:
+    crossings: Set[Point] = set()
+    orientations = list(Orientation)
+
+    for i, first in enumerate(orientations):
+        for second in orientations[i+1:]:
+            constants = sorted(covered[second])
+
+            for constant, intervals in covered[first].items():
+                for interval in intervals:
+                    crossings.update(find_segment_crossings(first, constant, interval, second, constants, covered[second]))
+
+    return crossings
+
+def find_segment_crossings(first: Orientation, constant: int, interval: Interval,
+                           second: Orientation, constants: List[int], segments: Segments) -> List[Point]:
+    crossings: List[Point] = []
+
+    # The second orientation's constant changes linearly along the segment
+    start_constant = second.get_key(first.get_point(constant, interval.start))[0]
+    end_constant = second.get_key(first.get_point(constant, interval.end))[0]
+    constant_change = end_constant - start_constant
+    length = interval.end - interval.start
+
+    low = bisect.bisect_left(constants, min(start_constant, end_constant))
+    high = bisect.bisect_right(constants, max(start_constant, end_constant))
+
+    for other_constant in constants[low:high]:
+        offset = (other_constant - start_constant) * length
+
+        # Crossings between diagonals can fall between grid points
+        if constant_change and offset % constant_change:
+            continue
+
+        position = interval.start + (offset // constant_change if constant_change else 0)
+        point = first.get_point(constant, position)
+
+        if contains(segments[other_constant], second.get_key(point)[1]):
+            crossings.append(point)
+
+    return crossings
+
+
 def main():
     lines = read_lines()
     map = Map()
@@ -56,6 +216,17 @@ def main():
     print(f'Answer: {answer}')
 
 
+def main_sweep():
+    lines = read_lines()
+    map = SweepMap()
+
+    for line in lines:
+        map.add_line(line)
+
+    answer = map.count_overlapping_points()
+    print(f'Answer: {answer}')
+
+
 def read_lines() -> List[Line]:
     with open('input.txt') as f:
         lines = [parse_line(l) for l in f]
@@ -1,12 +1,17 @@
 #!/usr/bin/env python3
-from typing import List
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
 
 CYCLE_START = 6
 NEW_START = 8
+STATE_COUNT = NEW_START + 1
+
+Matrix = Sequence[Sequence[int]]
+FrozenMatrix = Tuple[Tuple[int, ...], ...]
 
 class Species:
     def __init__(self, initial_states: List[int]):
-        self.state_counts = [0] * (NEW_START + 1)
+        self.state_counts = [0] * STATE_COUNT
 
         for state in initial_states:
             self.state_counts[state] += 1
@@ -20,10 +25,71 @@ class Species:
         self.state_counts[CYCLE_START] += zero_count
         self.state_counts.append(zero_count)
 
+    def fast_forward(self, days: int, modulus: Optional[int] = None):
+        # Apply the transition raised to each power of two set in days
+        for bit in range(days.bit_length()):
+            if days >> bit & 1:
+                power = get_transition_power(bit, modulus)
+                self.state_counts = multiply_vector(self.state_counts, power, modulus)
+
     def count(self) -> int:
         return sum(self.state_counts)
 
 
+def get_transition_matrix() -> List[List[int]]:
+    # matrix[a][b] is how many fish in state b one fish in state a becomes after a day
+    matrix = [[0] * STATE_COUNT for _ in range(STATE_COUNT)]
+
+    for state in range(1, STATE_COUNT):
+        matrix[state][state - 1] = 1
+
+    matrix[0][CYCLE_START] += 1
+    matrix[0][NEW_START] += 1
+
+    return matrix
+
+@lru_cache(maxsize=256)
+def get_transition_power(bit: int, modulus: Optional[int] = None) -> FrozenMatrix:
+    # The transition matrix for 2 ** bit days
+    if bit == 0:
+        matrix = get_transition_matrix()
+    else:
+        half = get_transition_power(bit - 1, modulus)
+        matrix = multiply_matrices(half, half, modulus)
+
+    return tuple(tuple(row) for row in matrix)
+
+@lru_cache(maxsize=256)
+def get_days_matrix(days: int, modulus: Optional[int] = None) -> FrozenMatrix:
+    matrix: Matrix = get_identity_matrix()
+
+    for bit in range(days.bit_length()):
+        if days >> bit & 1:
+            matrix = multiply_matrices(matrix, get_transition_power(bit, modulus), modulus)
+
+    return tuple(tuple(row) for row in matrix)
+
+def get_identity_matrix() -> List[List[int]]:
+    return [[int(a == b) for b in range(STATE_COUNT)] for a in range(STATE_COUNT)]
+
+def fast_forward_populations(populations: List[List[int]], horizons: List[int],
+                             modulus: Optional[int] = None) -> List[List[int]]:
+    return [multiply_vector(state_counts, get_days_matrix(days, modulus), modulus)
+            for state_counts, days in zip(populations, horizons)]
+
+def multiply_vector(vector: Sequence[int], matrix: Matrix, modulus: Optional[int] = None) -> List[int]:
+    result = [sum(v * row[j] for v, row in zip(vector, matrix)) for j in range(len(matrix[0]))]
+
+    # Counts grow exponentially, so very long horizons are only tractable modulo something
+    if modulus:
+        result = [r % modulus for r in result]
+
+    return result
+
+def multiply_matrices(a: Matrix, b: Matrix, modulus: Optional[int] = None) -> List[List[int]]:
+    return [multiply_vector(row, b, modulus) for row in a]
+
+
 def main():
     initial_states = read_initial_states()
 
@@ -35,6 +101,17 @@ def main():
 
 
 
+def main_fast_forward():
+    initial_states = read_initial_states()
+
+    species = Species(initial_states)
+    species.fast_forward(256)
+
+    answer = species.count()
+    print(f'Answer: {answer}')
+
+
+
 def read_initial_states() -> List[int]:
     with open('input.txt') as f:
         return [int(s) for s in f.readline().split(',')]
@@ -1,5 +1,27 @@
 #!/usr/bin/env python3
-from typing import List
+from dataclasses import dataclass
+from math import comb
+from typing import List, Tuple
+
+@dataclass(frozen=True)
+class CostPolynomial:
+    # Fuel for a distance n is sum(c * n**k for k, c in enumerate(coefficients)) / divisor,
+    # which must be a whole number for every n so the divisor can be applied to the total
+    coefficients: Tuple[int, ...]
+    divisor: int = 1
+
+    def __post_init__(self):
+        # A polynomial of degree d is integer-valued everywhere if it is at d + 1 consecutive points
+        for n in range(len(self.coefficients)):
+            if self.evaluate(n) % self.divisor:
+                raise ValueError(f'Fuel for distance {n} is not a whole number')
+
+    def evaluate(self, n: int) -> int:
+        return sum(c * n**k for k, c in enumerate(self.coefficients))
+
+LINEAR_COST = CostPolynomial((0, 1))
+TRIANGULAR_COST = CostPolynomial((0, 1, 1), 2)
+
 
 def main():
     positions = read_positions()
@@ -13,6 +35,71 @@ def main():
     print(f'Answer: {min_fuel}')
 
 
+def main_mean():
+    positions = read_positions()
+
+    candidates = get_mean_candidates(positions)
+
+    min_fuel = min(calculate_total_fuel(positions, p) for p in candidates)
+    print(f'Answer: {min_fuel}')
+
+
+def get_mean_candidates(positions: List[int]) -> range:
+    # The cost is convex with its real minimum within 0.5 of the mean,
+    # so the integer minimum is one of the integers bracketing that interval
+    count = len(positions)
+    total = sum(positions)
+
+    low = (2 * total - count) // (2 * count)
+    high = -((-2 * total - count) // (2 * count))
+    return range(low, high + 1)
+
+def main_curve():
+    positions = read_positions()
+
+    fuel_required = calculate_cost_curve(positions, TRIANGULAR_COST)
+    min_fuel = min(fuel_required)
+    print(f'Answer: {min_fuel}')
+
+
+def calculate_cost_curve(positions: List[int], cost: CostPolynomial) -> List[int]:
+    min_p = min(positions)
+    max_p = max(positions)
+    degree = len(cost.coefficients) - 1
+
+    counts = [0] * (max_p - min_p + 1)
+    for x in positions:
+        counts[x - min_p] += 1
+
+    # Running sums of x**j for crabs at or left of p, and for all crabs
+    left_moments = [0] * (degree + 1)
+    total_moments = [sum(x**j for x in positions) for j in range(degree + 1)]
+
+    # Expand (p - x)**k on the left and (x - p)**k on the right binomially, as
+    # factor * p**(k - j) * x**j terms with a sign for each side
+    terms = [(coefficient * comb(k, j), k - j, j, (-1)**j, (-1)**(k - j))
+             for k, coefficient in enumerate(cost.coefficients) if coefficient
+             for j in range(k + 1)]
+
+    curve: List[int] = []
+
+    for p in range(min_p, max_p + 1):
+        powers = [p**j for j in range(degree + 1)]
+
+        count = counts[p - min_p]
+        if count:
+            for j in range(degree + 1):
+                left_moments[j] += count * powers[j]
+
+        total = 0
+        for factor, p_power, j, left_sign, right_sign in terms:
+            right_moment = total_moments[j] - left_moments[j]
+            total += factor * powers[p_power] * (left_sign * left_moments[j] + right_sign * right_moment)
+
+        curve.append(total // cost.divisor)
+
+    return curve
+
 def calculate_total_fuel(positions: List[int], p: int):
     return sum([calculate_fuel_between(a, p) for a in positions])
 
@@ -1,8 +1,15 @@
 #!/usr/bin/env python3
-from typing import Set, List, Callable
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Set, List, Callable, Dict, Iterable, NamedTuple, Optional
+import os
 
 Config = Set[str]
 
+SEGMENTS = 'abcdefg'
+SEGMENT_BYTES = SEGMENTS.encode()
+DIGIT_SEGMENTS = ['abcefg', 'cf', 'acdeg', 'acdfg', 'bcdf', 'abdfg', 'abdefg', 'acf', 'abcdefg', 'abcdfg']
+
 class Display:
     def __init__(self, configs: List[Config], outputs: List[Config]):
         self.outputs = outputs
@@ -39,6 +46,107 @@ class Display:
         return self.digit_configs.index(config)
 
 
+def get_segment_frequencies(configurations: str) -> Dict[str, int]:
+    return {segment: configurations.count(segment) for segment in SEGMENTS}
+
+def get_signature_digits() -> Dict[int, int]:
+    # Summing how often each lit segment appears across all ten digits doesn't
+    # depend on the wiring, and happens to give a different total for every digit
+    frequencies = get_segment_frequencies(' '.join(DIGIT_SEGMENTS))
+    return {sum(map(frequencies.__getitem__, segments)): digit for digit, segments in enumerate(DIGIT_SEGMENTS)}
+
+SIGNATURE_DIGITS = get_signature_digits()
+
+def decode_display(line: str) -> int:
+    configurations, outputs = line.split('|')
+    frequencies = get_segment_frequencies(configurations)
+
+    value = 0
+    for output in outputs.split():
+        value = value * 10 + SIGNATURE_DIGITS[sum(map(frequencies.__getitem__, output))]
+
+    return value
+
+
+class Chunk(NamedTuple):
+    start: int
+    end: int
+
+class ChunkTotals(NamedTuple):
+    total: int
+    digit_counts: List[int]
+
+def find_chunks(filename: str, count: int) -> List[Chunk]:
+    size = os.path.getsize(filename)
+    boundaries = [0]
+
+    with open(filename, 'rb') as f:
+        for i in range(1, count):
+            offset = size * i // count
+
+            if offset <= boundaries[-1]:
+                continue
+
+            # Move the boundary forward to the start of the next line
+            f.seek(offset)
+            f.readline()
+            boundaries.append(f.tell())
+
+    boundaries.append(size)
+
+    return [Chunk(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+def decode_chunk(filename: str, chunk: Chunk) -> ChunkTotals:
+    total = 0
+    digit_counts = [0] * 10
+    remaining = chunk.end - chunk.start
+
+    with open(filename, 'rb') as f:
+        f.seek(chunk.start)
+
+        # Lines are decoded as raw bytes while they're read, so a worker never
+        # holds more than one line of its chunk
+        for line in f:
+            if remaining <= 0:
+                break
+
+            remaining -= len(line)
+            bar = line.find(b'|')
+            if bar < 0:
+                continue
+
+            # Swapping each segment for its frequency turns an output's signature into a plain byte sum
+            frequencies = bytes([line.count(segment, 0, bar) for segment in SEGMENT_BYTES])
+            table = bytes.maketrans(SEGMENT_BYTES, frequencies)
+
+            value = 0
+            for output in line[bar + 1:].split():
+                digit = SIGNATURE_DIGITS[sum(output.translate(table))]
+                digit_counts[digit] += 1
+                value = value * 10 + digit
+
+            total += value
+
+    return ChunkTotals(total, digit_counts)
+
+def merge_chunk_totals(chunk_totals: Iterable[ChunkTotals]) -> ChunkTotals:
+    total = 0
+    digit_counts = [0] * 10
+
+    for chunk_total in chunk_totals:
+        total += chunk_total.total
+        digit_counts = [a + b for a, b in zip(digit_counts, chunk_total.digit_counts)]
+
+    return ChunkTotals(total, digit_counts)
+
+def decode_file(filename: str, workers: Optional[int] = None) -> ChunkTotals:
+    workers = workers or os.cpu_count() or 1
+    chunks = find_chunks(filename, workers)
+
+    with ProcessPoolExecutor(workers) as executor:
+        return merge_chunk_totals(executor.map(decode_chunk, repeat(filename), chunks))
+
+
 def main():
     displays = read_displays()
 
@@ -47,6 +155,19 @@ def main():
     print(f'Answer: {total}')
 
 
+def main_bitmask():
+    with open('input.txt') as f:
+        total = sum(decode_display(l) for l in f)
+
+    print(f'Answer: {total}')
+
+
+def main_parallel(workers: Optional[int] = None):
+    totals = decode_file('input.txt', workers)
+
+    print(f'Answer: {totals.total}')
+
+
 def read_displays() -> List[Display]:
     with open('input.txt') as f:
         return [parse_display(l) for l in f]
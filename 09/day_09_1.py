@@ -1,6 +1,11 @@
 #!/usr/bin/env python3
 from dataclasses import dataclass
-from typing import List
+from itertools import chain, compress
+from typing import Iterable, List
+import operator
+
+# Sorts after every digit, so it acts as an infinitely high border
+PADDING = b':'
 
 @dataclass
 class Map:
@@ -64,6 +69,43 @@ def main():
     print(f'Answer: {answer}')
 
 
+def main_streaming():
+    with open('input.txt', 'rb') as f:
+        answer = calculate_risk_sum(f)
+
+    print(f'Answer: {answer}')
+
+
+def calculate_risk_sum(lines: Iterable[bytes]) -> int:
+    rows = (PADDING + l.strip() + PADDING for l in lines if l.strip())
+    current = next(rows, None)
+
+    if current is None:
+        return 0
+
+    border = PADDING * len(current)
+    above = border
+    risk_sum = 0
+
+    # Only three rows are held at a time, so memory stays flat however tall the map is.
+    # This is no faster than main() on a map that fits in memory
+    for below in chain(rows, [border]):
+        risk_sum += calculate_row_risk(above, current, below)
+        above, current = current, below
+
+    return risk_sum
+
+
+def calculate_row_risk(above: bytes, current: bytes, below: bytes) -> int:
+    heights = current[1:-1]
+    neighbour_mins = map(min, current[:-2], current[2:], above[1:-1], below[1:-1])
+
+    low_heights = list(compress(heights, map(operator.lt, heights, neighbour_mins)))
+
+    # Heights are ASCII digits, so the risk level of each is its byte value minus '0' plus one
+    return sum(low_heights) - len(low_heights) * (ord('0') - 1)
+
+
 def read_map() -> Map:
     with open('input.txt') as f:
         return Map([[int(x) for x in l.strip()] for l in f])
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
+from array import array
 from dataclasses import dataclass
-from typing import List, NamedTuple
+from itertools import compress
+from typing import Dict, Iterator, List, NamedTuple
+import heapq
+import operator
 
 class Point(NamedTuple):
     x: int
@@ -8,6 +12,13 @@ class Point(NamedTuple):
 
 Region = List[Point]
 
+# Higher than any height, so it acts as an infinitely high border
+PADDING = 10
+
+class Basin(NamedTuple):
+    low_point: Point
+    size: int
+
 @dataclass
 class Map:
     map: List[List[int]]
@@ -65,14 +76,68 @@ class Map:
 
         return region
 
+    def get_basins(self) -> List[Basin]:
+        heights = [h for row in self.map for h in row]
+        parents = array('l', range(len(heights)))
+        sizes = array('l', [1]) * len(heights)
+
+        def find(i: int) -> int:
+            while parents[i] != i:
+                parents[i] = parents[parents[i]]
+                i = parents[i]
+            return i
+
+        def union(a: int, b: int):
+            a = find(a)
+            b = find(b)
+
+            if a == b:
+                return
+
+            if sizes[a] < sizes[b]:
+                a, b = b, a
+
+            parents[b] = a
+            sizes[a] += sizes[b]
+
+        # Only the left and upper neighbours need joining in a single raster pass
+        for i, height in enumerate(heights):
+            if height == 9:
+                continue
+
+            x = i % self.width
+
+            if x > 0 and heights[i - 1] != 9:
+                union(i, i - 1)
+
+            if i >= self.width and heights[i - self.width] != 9:
+                union(i, i - self.width)
+
+        lowest: Dict[int, int] = {}
+
+        for i, height in enumerate(heights):
+            if height == 9:
+                continue
+
+            root = find(i)
+
+            if root not in lowest or height < heights[lowest[root]]:
+                lowest[root] = i
+
+        return [Basin(Point(i % self.width, i // self.width), sizes[root]) for root, i in lowest.items()]
+
     def get_low_points(self) -> List[Point]:
         low_points: List[Point] = []
 
-        for y in range(self.height):
-            for x in range(self.width):
-                point = Point(x, y)
-                if self.is_low_point(point):
-                    low_points.append(point)
+        padding = bytes([PADDING])
+        border = padding * (self.width + 2)
+        rows = [padding + bytes(row) + padding for row in self.map]
+
+        for y, current in enumerate(rows):
+            above = rows[y - 1] if y > 0 else border
+            below = rows[y + 1] if y < self.height - 1 else border
+
+            low_points.extend(Point(x, y) for x in get_row_low_points(above, current, below))
 
         return low_points
 
@@ -107,6 +172,13 @@ class Map:
         return self.map[point.y][point.x]
 
 
+def get_row_low_points(above: bytes, current: bytes, below: bytes) -> Iterator[int]:
+    heights = current[1:-1]
+    neighbour_mins = map(min, current[:-2], current[2:], above[1:-1], below[1:-1])
+
+    return compress(range(len(heights)), map(operator.lt, heights, neighbour_mins))
+
+
 def main():
     map = read_map()
 
@@ -123,6 +195,22 @@ def main():
 
 
 
+def main_union_find():
+    map = read_map()
+
+    basins = map.get_basins()
+
+    answer = get_top_product([basin.size for basin in basins], 3)
+    print(f'Answer: {answer}')
+
+
+def get_top_product(values: List[int], k: int) -> int:
+    mult = 1
+    for value in heapq.nlargest(k, values):
+        mult *= value
+    return mult
+
+
 def read_map() -> Map:
     with open('input.txt') as f:
         return Map([[int(x) for x in l.strip()] for l in f])
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
-from typing import List, Optional
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Iterable, List, NamedTuple, Optional, Tuple
 from statistics import median
+import os
+import random
 
 MATCHING_CHAR = {
     '(': ')',
@@ -16,6 +20,13 @@ CHAR_SCORES = {
     '>': 4
 }
 
+OPENING_BYTES = ''.join(MATCHING_CHAR).encode()
+PAIRS = [(opening + closing).encode() for opening, closing in MATCHING_CHAR.items()]
+CORRUPTION_SCORES = {ord(')'): 3, ord(']'): 57, ord('}'): 1197, ord('>'): 25137}
+
+# Opening brackets as base 5 digits, in completion score order
+COMPLETION_DIGITS = bytes.maketrans(OPENING_BYTES, b'1234')
+
 
 def main():
     lines = read_lines()
@@ -60,6 +71,157 @@ def calculate_completion_score(chars: List[str]) -> int:
     return score
 
 
+def main_bytes():
+    with open('input.txt', 'rb') as f:
+        lines = f.read().split(b'\n')
+
+    corruption_score = 0
+    scores: List[int] = []
+
+    for line in lines:
+        line_corruption_score, completion_score = score_line(line)
+        corruption_score += line_corruption_score
+
+        if completion_score:
+            scores.append(completion_score)
+
+    middle_score = median(scores)
+
+    print(f'Syntax Error Score: {corruption_score}')
+    print(f'Answer: {middle_score}')
+
+
+def score_line(line: bytes) -> Tuple[int, int]:
+    # Returns the corruption score and completion score, one of which is zero
+    line = line.strip()
+
+    # Strip matched pairs innermost first until none are left, each pass in C
+    reduced = None
+    while reduced != line:
+        reduced = line
+        for pair in PAIRS:
+            line = line.replace(pair, b'')
+
+    # Whatever closing brackets survive didn't match, and the first is the corrupt one
+    closing = line.translate(None, OPENING_BYTES)
+    if closing:
+        return CORRUPTION_SCORES[closing[0]], 0
+
+    if not line:
+        return 0, 0
+
+    # The unclosed brackets read innermost first are the completion score in base 5
+    return 0, int(line[::-1].translate(COMPLETION_DIGITS), 5)
+
+
+class Chunk(NamedTuple):
+    start: int
+    end: int
+
+class ChunkScores(NamedTuple):
+    corruption_score: int
+    completion_scores: List[int]
+
+
+def main_parallel(workers: Optional[int] = None):
+    scores = score_file('input.txt', workers)
+
+    middle_score = select_median(scores.completion_scores)
+
+    print(f'Syntax Error Score: {scores.corruption_score}')
+    print(f'Answer: {middle_score}')
+
+
+def score_file(filename: str, workers: Optional[int] = None) -> ChunkScores:
+    workers = workers or os.cpu_count() or 1
+    chunks = find_chunks(filename, workers)
+
+    with ProcessPoolExecutor(workers) as executor:
+        return merge_chunk_scores(executor.map(score_chunk, repeat(filename), chunks))
+
+
+def find_chunks(filename: str, count: int) -> List[Chunk]:
+    size = os.path.getsize(filename)
+    boundaries = [0]
+
+    with open(filename, 'rb') as f:
+        for i in range(1, count):
+            offset = size * i // count
+
+            if offset <= boundaries[-1]:
+                continue
+
+            # Move the boundary forward to the start of the next line
+            f.seek(offset)
+            f.readline()
+            boundaries.append(f.tell())
+
+    boundaries.append(size)
+
+    return [Chunk(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def score_chunk(filename: str, chunk: Chunk) -> ChunkScores:
+    corruption_score = 0
+    completion_scores: List[int] = []
+    remaining = chunk.end - chunk.start
+
+    with open(filename, 'rb') as f:
+        f.seek(chunk.start)
+
+        # Lines are scored as they're read, so a worker only holds its scores
+        for line in f:
+            if remaining <= 0:
+                break
+
+            remaining -= len(line)
+            line_corruption_score, completion_score = score_line(line)
+            corruption_score += line_corruption_score
+
+            if completion_score:
+                completion_scores.append(completion_score)
+
+    return ChunkScores(corruption_score, completion_scores)
+
+
+def merge_chunk_scores(chunk_scores: Iterable[ChunkScores]) -> ChunkScores:
+    corruption_score = 0
+    completion_scores: List[int] = []
+
+    for scores in chunk_scores:
+        corruption_score += scores.corruption_score
+        completion_scores.extend(scores.completion_scores)
+
+    return ChunkScores(corruption_score, completion_scores)
+
+
+def select_median(values: List[int]) -> float:
+    middle = len(values) // 2
+
+    if len(values) % 2:
+        return select(values, middle)
+
+    return (select(values, middle - 1) + select(values, middle)) / 2
+
+
+def select(values: List[int], k: int) -> int:
+    # Quickselect for the kth smallest value, without sorting everything
+    while True:
+        pivot = random.choice(values)
+
+        lower = [v for v in values if v < pivot]
+        if k < len(lower):
+            values = lower
+            continue
+
+        equal_count = sum(1 for v in values if v == pivot)
+        if k < len(lower) + equal_count:
+            return pivot
+
+        k -= len(lower) + equal_count
+        values = [v for v in values if v > pivot]
+
+
 def read_lines() -> List[str]:
     with open('input.txt') as f:
         return [l.strip() for l in f]
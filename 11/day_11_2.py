@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
-from typing import List, NamedTuple
-import os
-from time import sleep
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+import sys
+from time import monotonic, sleep
+
+# Enough bits for an energy of 9 plus the 1 + 8 increments a cell can get in a step
+ENERGY_BITS = 5
 
 class Point(NamedTuple):
     x: int
@@ -74,45 +77,287 @@ class Grid:
 
 
     def __str__(self) -> str:
-        output: str = ''
-        for row in self.grid:
-            for e in row:
-                if e == 0:
-                    output += f"\033[1m{e}\033[0m"
+        return ''.join(''.join(format_energy(e) for e in row) + '\n' for row in self.grid)
+
+
+def format_energy(e: int) -> str:
+    if e == 0:
+        return f"\033[1m{e}\033[0m"
+
+    return str(e)
+
+
+class Renderer:
+    def render(self, title: str, grid: Grid):
+        pass
+
+    def finish(self):
+        pass
+
+
+class HeadlessRenderer(Renderer):
+    pass
+
+
+class TerminalRenderer(Renderer):
+    def __init__(self, frame_rate: float = 20, drop_frames: bool = False):
+        self.frame_interval = 1 / frame_rate
+        self.drop_frames = drop_frames
+        self.next_frame = 0.0
+        self.previous: Optional[List[List[int]]] = None
+        self.pending: Optional[Tuple[str, Grid]] = None
+
+    def render(self, title: str, grid: Grid):
+        delay = self.next_frame - monotonic()
+
+        if delay > 0:
+            # Either skip frames that aren't due yet so the simulation never waits
+            # on the terminal, or wait for them so every step is shown
+            if self.drop_frames:
+                self.pending = (title, grid)
+                return
+
+            sleep(delay)
+
+        self.next_frame = monotonic() + self.frame_interval
+        self._draw(title, grid)
+
+    def finish(self):
+        if self.pending:
+            self._draw(*self.pending)
+
+        if self.previous is not None:
+            sys.stdout.write(f'\033[{len(self.previous) + 2};1H\n')
+
+    def _draw(self, title: str, grid: Grid):
+        self.pending = None
+
+        # Move the cursor home and redraw only the cells that changed since the last drawn frame
+        output = ['\033[H', title, '\033[K']
+
+        if self.previous is None:
+            output.insert(0, '\033[2J')
+            output.append('\n' + str(grid))
+        else:
+            for y, row in enumerate(grid.grid):
+                for x, e in enumerate(row):
+                    if e != self.previous[y][x]:
+                        output.append(f'\033[{y + 2};{x + 1}H{format_energy(e)}')
+
+        self.previous = [list(row) for row in grid.grid]
+
+        sys.stdout.write(''.join(output))
+        sys.stdout.flush()
+
+
+
+class BitGrid:
+    def __init__(self, grids: List[List[List[int]]]):
+        self.count = len(grids)
+        self.height = len(grids[0])
+        self.width = len(grids[0][0])
+
+        # Each row is followed by a guard column and each colony by a guard row,
+        # padded to a whole number of bytes so colonies can be sliced out as bytes
+        self.stride = self.width + 1
+        self.colony_bytes = (self.stride * (self.height + 1) + 7) // 8
+        self.colony_size = self.colony_bytes * 8
+        self.offsets = [dy * self.stride + dx for dy in (-1, 0, 1) for dx in (-1, 0, 1) if dy or dx]
+
+        cells = [0] * (self.colony_size * self.count)
+        valid = [0] * len(cells)
+
+        for g, grid in enumerate(grids):
+            for y, row in enumerate(grid):
+                for x, e in enumerate(row):
+                    i = self._get_index(g, x, y)
+                    cells[i] = e
+                    valid[i] = 1
+
+        # Bit-sliced energies: bit i of planes[b] is bit b of cell i's energy
+        self.planes = [to_bitset(e >> b & 1 for e in cells) for b in range(ENERGY_BITS)]
+        self.valid = to_bitset(valid)
+        self.colony_mask = self.valid & ((1 << self.colony_size) - 1)
+        self.flashes = [0] * self.count
+
+    def step(self) -> List[int]:
+        self._increment(self.valid)
+
+        flashed = 0
+        flashing = self._get_over_nine()
+
+        while flashing:
+            flashed |= flashing
+
+            for offset in self.offsets:
+                if offset > 0:
+                    neighbours = flashing << offset
                 else:
-                    output += str(e)
-            output += '\n'
-        return output
+                    neighbours = flashing >> -offset
+
+                self._increment(neighbours & self.valid)
+
+            flashing = self._get_over_nine() & ~flashed
+
+        self.planes = [plane & ~flashed for plane in self.planes]
+
+        step_flashes = self._count_per_colony(flashed)
+        self.flashes = [a + b for a, b in zip(self.flashes, step_flashes)]
+        return step_flashes
+
+    def to_grid(self, colony: int) -> List[List[int]]:
+        return [[self._get_energy(self._get_index(colony, x, y)) for x in range(self.width)] for y in range(self.height)]
+
+    def _increment(self, mask: int):
+        # Ripple-carry add of one to every cell in mask
+        for b in range(ENERGY_BITS):
+            carry = self.planes[b] & mask
+            self.planes[b] ^= mask
+            mask = carry
+
+            if not mask:
+                break
+
+    def _get_over_nine(self) -> int:
+        # Energies of 16 or more, or 8 plus 2 or 4
+        p = self.planes
+        return p[4] | (p[3] & (p[2] | p[1]))
 
+    def _count_per_colony(self, mask: int) -> List[int]:
+        data = mask.to_bytes(self.colony_bytes * self.count, 'little')
+        size = self.colony_bytes
 
+        # int.bit_count() needs Python 3.10
+        return [bin(int.from_bytes(data[g * size:(g + 1) * size], 'little')).count('1') for g in range(self.count)]
 
-def main():
+    def _get_energy(self, i: int) -> int:
+        return sum((plane >> i & 1) << b for b, plane in enumerate(self.planes))
+
+    def _get_index(self, colony: int, x: int, y: int) -> int:
+        return colony * self.colony_size + y * self.stride + x
+
+
+class CycleInfo(NamedTuple):
+    start: int
+    length: int
+    # Flashes during each step, up to the end of the first full cycle
+    flash_counts: List[int]
+
+
+def find_cycle(energies: List[List[int]]) -> CycleInfo:
+    # Brent's algorithm only ever compares two states, so the bitplanes
+    # themselves act as an exact state digest
+    grid = BitGrid([energies])
+    tortoise = list(grid.planes)
+    grid.step()
+
+    power = length = 1
+
+    while grid.planes != tortoise:
+        if power == length:
+            tortoise = list(grid.planes)
+            power *= 2
+            length = 0
+
+        grid.step()
+        length += 1
+
+    tortoise_grid = BitGrid([energies])
+    hare_grid = BitGrid([energies])
+
+    for _ in range(length):
+        hare_grid.step()
+
+    start = 0
+
+    while tortoise_grid.planes != hare_grid.planes:
+        tortoise_grid.step()
+        hare_grid.step()
+        start += 1
+
+    grid = BitGrid([energies])
+    flash_counts = [grid.step()[0] for _ in range(start + length)]
+
+    return CycleInfo(start, length, flash_counts)
+
+
+def count_flashes(cycle: CycleInfo, steps: int) -> int:
+    if steps <= len(cycle.flash_counts):
+        return sum(cycle.flash_counts[:steps])
+
+    cycle_counts = cycle.flash_counts[cycle.start:]
+    full_cycles, remainder = divmod(steps - cycle.start, cycle.length)
+
+    return (sum(cycle.flash_counts[:cycle.start])
+            + full_cycles * sum(cycle_counts)
+            + sum(cycle_counts[:remainder]))
+
+
+def find_first_synchronized_step(cycle: CycleInfo, cell_count: int) -> Optional[int]:
+    # Every reachable state is seen by the end of the first cycle
+    for i, flashes in enumerate(cycle.flash_counts):
+        if flashes == cell_count:
+            return i + 1
+
+    return None
+
+
+def to_bitset(bits: Iterable[int]) -> int:
+    return int(''.join('1' if b else '0' for b in bits)[::-1] or '0', 2)
+
+
+def main(renderer: Optional[Renderer] = None):
     grid = read_grid()
+    renderer = renderer or TerminalRenderer()
 
-    clear_screen()
-    print(f'Before any steps:')
-    print(grid)
+    renderer.render('Before any steps:', grid)
 
     step = 0
 
     while not grid.all_equal():
         step += 1
         grid.step()
-        clear_screen()
-        print(f'After step {step}:')
-        print(grid)
-        sleep(0.05)
+        renderer.render(f'After step {step}:', grid)
+
+    renderer.finish()
 
     print(f'Answer: {step}')
 
 
+def main_headless():
+    main(HeadlessRenderer())
+
+
+def main_bitboard():
+    grid = BitGrid([read_energies()])
+
+    step = 1
+    while grid.step()[0] != grid.width * grid.height:
+        step += 1
+
+    print(f'Answer: {step}')
+
+
+def main_cycle():
+    energies = read_energies()
+    cycle = find_cycle(energies)
+
+    cell_count = len(energies) * len(energies[0])
+    step = find_first_synchronized_step(cycle, cell_count)
+
+    print(f'Cycle Start: {cycle.start}')
+    print(f'Cycle Length: {cycle.length}')
+    print(f'Flashes After 100 Steps: {count_flashes(cycle, 100)}')
+    print(f'Answer: {step}')
+
+
 def read_grid() -> Grid:
-    with open('input.txt') as f:
-        return Grid([[int(e) for e in l.strip()] for l in f])
+    return Grid(read_energies())
 
 
-def clear_screen():
-    os.system('clear')
+def read_energies() -> List[List[int]]:
+    with open('input.txt') as f:
+        return [[int(e) for e in l.strip()] for l in f]
 
 
 if __name__ == '__main__':